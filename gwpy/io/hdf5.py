@@ -20,7 +20,7 @@
 """
 
 import os.path
-from functools import wraps
+from functools import (partial, wraps)
 
 # pylint: disable=unused-import
 from astropy.io.misc.hdf5 import is_hdf5 as identify_hdf5  # noqa: F401
@@ -32,30 +32,42 @@ from .cache import FILE_LIKE
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
 
-def open_hdf5(filename, mode='r'):
+def open_hdf5(filename, mode='r', **kwargs):
     """Wrapper to open a :class:`h5py.File` from disk, gracefully
     handling a few corner cases
+
+    Any ``kwargs`` are passed to :class:`h5py.File`.
     """
     if isinstance(filename, (h5py.Group, h5py.Dataset)):
         return filename
     if isinstance(filename, FILE_LIKE):
-        return h5py.File(filename.name, mode)
-    return h5py.File(filename, mode)
+        return h5py.File(filename.name, mode, **kwargs)
+    return h5py.File(filename, mode, **kwargs)
 
 
-def with_read_hdf5(func):
+def with_read_hdf5(func=None, **open_kwargs):
     """Decorate an HDF5-reading function to open a filepath if needed
 
     ``func`` should be written to presume an `h5py.Group` as the first
     positional argument.
+
+    Any ``open_kwargs`` are passed to :func:`open_hdf5` when opening a
+    file, and can be overridden by passing a keyword of the same name
+    to the decorated function, e.g.::
+
+        @with_read_hdf5(rdcc_nbytes=2 ** 26)
+        def read_thing(h5g, path=None):
+            ...
     """
+    if func is None:
+        return partial(with_read_hdf5, **open_kwargs)
+
     @wraps(func)
     def decorated_func(fobj, *args, **kwargs):
         # pylint: disable=missing-docstring
+        h5kw = {key: kwargs.pop(key, val) for key, val in open_kwargs.items()}
         if not isinstance(fobj, h5py.HLObject):
-            if isinstance(fobj, FILE_LIKE):
-                fobj = fobj.name
-            with h5py.File(fobj, 'r') as h5f:
+            with open_hdf5(fobj, 'r', **h5kw) as h5f:
                 return func(h5f, *args, **kwargs)
         return func(fobj, *args, **kwargs)
 
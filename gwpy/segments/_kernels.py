@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Cardiff University (2023)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Linear-time union of coalesced lists of segments
+
+`union_sorted` takes the ``(starts, ends)`` boundaries of two coalesced
+segment lists as `float` arrays, and performs a single simultaneous sweep
+through both lists.
+
+Rather than returning new boundary values, it returns two arrays of
+indices identifying the start and end of each output segment within the
+concatenation ``[s1[0], e1[0], s1[1], e1[1], ..., s2[0], e2[0], ...]``
+of the input boundaries.
+This allows the caller to reuse the original boundary objects, so the
+type of each boundary is preserved.
+
+If `numba` is installed, this function is compiled on first use,
+otherwise it is plain Python (which is much slower than the
+`ligo.segments` implementation, and so should not be used).
+"""
+
+import numpy
+
+# numba is optional
+try:
+    from numba import njit
+except ImportError:  # no numba
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+else:
+    HAS_NUMBA = True
+
+__author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
+
+
+@njit(cache=True)
+def union_sorted(s1, e1, s2, e2):
+    """Find the union of two coalesced lists of segments
+    """
+    n = s1.size
+    m = s2.size
+    lo = numpy.empty(n + m, dtype=numpy.int64)
+    hi = numpy.empty(n + m, dtype=numpy.int64)
+    i = j = 0
+    k = -1
+    current = 0.
+    while i < n or j < m:
+        # take the next segment (ordered by start) from either list
+        if j >= m or (i < n and s1[i] <= s2[j]):
+            start = s1[i]
+            end = e1[i]
+            idx = 2 * i
+            i += 1
+        else:
+            start = s2[j]
+            end = e2[j]
+            idx = 2 * (n + j)
+            j += 1
+        # merge with the current output segment, or start a new one
+        if k >= 0 and start <= current:
+            if end > current:
+                hi[k] = idx + 1
+                current = end
+        else:
+            k += 1
+            lo[k] = idx
+            hi[k] = idx + 1
+            current = end
+    return lo[:k+1], hi[:k+1]
@@ -36,13 +36,14 @@ import warnings
 from io import BytesIO
 from collections import OrderedDict
 from copy import (copy as shallowcopy, deepcopy)
-from functools import reduce
+from functools import (lru_cache, reduce)
 from math import (floor, ceil)
 from queue import Queue
 from threading import Thread
 from urllib.error import (URLError, HTTPError)
 from urllib.parse import urlparse
 
+import numpy
 from numpy import inf
 
 from astropy.io import registry as io_registry
@@ -60,10 +61,9 @@ from .segments import Segment, SegmentList
 __author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
 __all__ = ['DataQualityFlag', 'DataQualityDict']
 
-re_IFO_TAG_VERSION = re.compile(
-    r"\A(?P<ifo>[A-Z]\d):(?P<tag>[^/]+):(?P<version>\d+)\Z")
-re_IFO_TAG = re.compile(r"\A(?P<ifo>[A-Z]\d):(?P<tag>[^/]+)\Z")
-re_TAG_VERSION = re.compile(r"\A(?P<tag>[^/]+):(?P<version>\d+)\Z")
+# {ifo}:{tag}:{version}, where either ifo or version may be omitted
+re_FLAG_NAME = re.compile(
+    r"\A(?:(?P<ifo>[A-Z]\d):)?(?P<tag>[^/]+?)(?::(?P<version>\d+))?\Z")
 
 DEFAULT_SEGMENT_SERVER = os.getenv('DEFAULT_SEGMENT_SERVER',
                                    'https://segments.ligo.org')
@@ -97,6 +97,81 @@ def _parse_query_segments(args, func):
     return SegmentList([Segment(to_gps(start), to_gps(end))])
 
 
+def _pad_segmentlist(segmentlist, start, end):
+    """Apply a padding to the start and end of each segment in a list
+
+    If the padding is given as `float`, and the list contains only plain
+    numbers, the padding is applied to the array representation of the
+    list in one go.
+    """
+    if (
+        isinstance(start, float)
+        and isinstance(end, float)
+        and segmentlist._exact
+    ):
+        starts, ends = segmentlist._as_soa()
+        return SegmentList._from_soa(starts + start, ends + end)
+    return [(s[0]+start, s[1]+end) for s in segmentlist]
+
+
+def _round_segment(seg, contract=False):
+    """Round a segment to integer boundaries
+    """
+    if contract:  # round inwards
+        a = type(seg[0])(ceil(seg[0]))
+        b = type(seg[1])(floor(seg[1]))
+    else:  # round outwards
+        a = type(seg[0])(floor(seg[0]))
+        b = type(seg[1])(ceil(seg[1]))
+    if a >= b:  # if segment is too short, return 'null' segment
+        return type(seg)(0, 0)  # will get coalesced away
+    return type(seg)(a, b)
+
+
+def _round_segmentlist(segmentlist, contract=False):
+    """Round each segment in a list to integer boundaries
+
+    If the list contains only plain numbers, the array representation
+    of the list is rounded in one go, and segments that are too short
+    are removed. Lists of integers are already rounded, so are returned
+    as a copy.
+    """
+    if not segmentlist._exact:
+        return [_round_segment(seg, contract=contract) for seg in segmentlist]
+    if segmentlist._integer:
+        return SegmentList(segmentlist)._inherit_cache(segmentlist)
+    starts, ends = segmentlist._as_soa()
+    if contract:  # round inwards
+        starts, ends = numpy.ceil(starts), numpy.floor(ends)
+    else:  # round outwards
+        starts, ends = numpy.floor(starts), numpy.ceil(ends)
+    keep = starts < ends
+    return SegmentList._from_soa(starts[keep], ends[keep])
+
+
+@lru_cache(maxsize=1024)
+def _parse_flag_name(name):
+    """Parse a flag name into its ``(ifo, tag, version)`` components
+
+    Raises
+    ------
+    ValueError
+        if ``name`` doesn't contain at least an ``ifo`` or a ``version``
+    """
+    match = re_FLAG_NAME.match(name)
+    if match is None or match['ifo'] is match['version'] is None:
+        raise ValueError("No flag name structure detected in '%s', flags "
+                         "should be named as '{ifo}:{tag}:{version}'. "
+                         "For arbitrary strings, use the "
+                         "`DataQualityFlag.label` attribute" % name)
+    version = match['version']
+    return (
+        match['ifo'],
+        match['tag'],
+        None if version is None else int(version),
+    )
+
+
 # -- DataQualityFlag ----------------------------------------------------------
 
 class DataQualityFlag(object):
@@ -238,7 +313,7 @@ class DataQualityFlag(object):
         if segmentlist is None:
             del self.active
         else:
-            self._active = self._ListClass(map(self._EntryClass, segmentlist))
+            self._active = self._as_segmentlist(segmentlist)
 
     @active.deleter
     def active(self):
@@ -256,7 +331,7 @@ class DataQualityFlag(object):
         if segmentlist is None:
             del self.known
         else:
-            self._known = self._ListClass(map(self._EntryClass, segmentlist))
+            self._known = self._as_segmentlist(segmentlist)
 
     @known.deleter
     def known(self):
@@ -499,6 +574,11 @@ class DataQualityFlag(object):
             require segment start and stop times match printed duration,
             only valid for ``format='segwizard'``.
 
+        cache_size : `int`, optional
+            size (in bytes) of the raw data chunk cache to use when
+            opening HDF5 files, defaults to 64 MiB, only used for
+            ``format='hdf5'``
+
         coalesce : `bool`, optional
             if `True` coalesce the all segment lists before returning,
             otherwise return exactly as contained in file(s).
@@ -688,13 +768,13 @@ class DataQualityFlag(object):
 
         if kwargs.pop('inplace', False):
             new = self
-        else:
-            new = self.copy()
+        else:  # known and active are replaced below, so needn't be copied
+            new = shallowcopy(self)
         if kwargs:
             raise TypeError("unexpected keyword argument %r"
                             % list(kwargs.keys())[0])
-        new.known = [(s[0]+start, s[1]+end) for s in self.known]
-        new.active = [(s[0]+start, s[1]+end) for s in self.active]
+        new.known = _pad_segmentlist(self.known, start, end)
+        new.active = _pad_segmentlist(self.active, start, end)
         return new
 
     def round(self, contract=False):
@@ -713,20 +793,9 @@ class DataQualityFlag(object):
             A copy of the original flag with the `active` and `known` segments
             padded out to integer boundaries.
         """
-        def _round(seg):
-            if contract:  # round inwards
-                a = type(seg[0])(ceil(seg[0]))
-                b = type(seg[1])(floor(seg[1]))
-            else:  # round outwards
-                a = type(seg[0])(floor(seg[0]))
-                b = type(seg[1])(ceil(seg[1]))
-            if a >= b:  # if segment is too short, return 'null' segment
-                return type(seg)(0, 0)  # will get coalesced away
-            return type(seg)(a, b)
-
-        new = self.copy()
-        new.active = type(new.active)(map(_round, new.active))
-        new.known = type(new.known)(map(_round, new.known))
+        new = shallowcopy(self)
+        new.active = _round_segmentlist(self.active, contract=contract)
+        new.known = _round_segmentlist(self.known, contract=contract)
         return new.coalesce()
 
     def coalesce(self):
@@ -832,6 +901,14 @@ class DataQualityFlag(object):
         kwargs.update(figsize=figsize, xscale=xscale)
         return Plot(self, projection='segments', **kwargs)
 
+    def _as_segmentlist(self, segments):
+        """Copy ``segments`` into a new list of the right types
+        """
+        new = self._ListClass(map(self._EntryClass, segments))
+        if isinstance(segments, SegmentList):
+            new._inherit_cache(segments)
+        return new
+
     def _parse_name(self, name):
         """Internal method to parse a `string` name into constituent
         `ifo, `name` and `version` components.
@@ -860,26 +937,8 @@ class DataQualityFlag(object):
             self.ifo = None
             self.tag = None
             self.version = None
-        elif re_IFO_TAG_VERSION.match(name):
-            match = re_IFO_TAG_VERSION.match(name).groupdict()
-            self.ifo = match['ifo']
-            self.tag = match['tag']
-            self.version = int(match['version'])
-        elif re_IFO_TAG.match(name):
-            match = re_IFO_TAG.match(name).groupdict()
-            self.ifo = match['ifo']
-            self.tag = match['tag']
-            self.version = None
-        elif re_TAG_VERSION.match(name):
-            match = re_TAG_VERSION.match(name).groupdict()
-            self.ifo = None
-            self.tag = match['tag']
-            self.version = int(match['version'])
         else:
-            raise ValueError("No flag name structure detected in '%s', flags "
-                             "should be named as '{ifo}:{tag}:{version}'. "
-                             "For arbitrary strings, use the "
-                             "`DataQualityFlag.label` attribute" % name)
+            self.ifo, self.tag, self.version = _parse_flag_name(name)
         return self.ifo, self.tag, self.version
 
     def __and__(self, other):
@@ -1063,6 +1122,11 @@ class DataQualityDict(OrderedDict):
         names : `list`, optional, default: read all names found
             list of names to read, by default all names are read separately.
 
+        cache_size : `int`, optional
+            size (in bytes) of the raw data chunk cache to use when
+            opening HDF5 files, defaults to 64 MiB, only used for
+            ``format='hdf5'``
+
         coalesce : `bool`, optional
             if `True` coalesce the all segment lists before returning,
             otherwise return exactly as contained in file(s).
@@ -1546,7 +1610,10 @@ class DataQualityDict(OrderedDict):
             a new `DataQualityFlag` who's active and known segments
             are the union of those of the values of this dict
         """
-        usegs = reduce(operator.or_, self.values())
+        flags = list(self.values())
+        usegs = shallowcopy(flags[0])
+        usegs.known = SegmentList._union_all(f.known for f in flags)
+        usegs.active = SegmentList._union_all(f.active for f in flags)
         usegs.name = ' | '.join(self.keys())
         return usegs
 
@@ -1559,7 +1626,10 @@ class DataQualityDict(OrderedDict):
             a new `DataQualityFlag` who's active and known segments
             are the intersection of those of the values of this dict
         """
-        isegs = reduce(operator.and_, self.values())
+        flags = list(self.values())
+        isegs = shallowcopy(flags[0])
+        isegs.known = reduce(operator.and_, (f.known for f in flags))
+        isegs.active = reduce(operator.and_, (f.active for f in flags))
         isegs.name = ' & '.join(self.keys())
         return isegs
 
@@ -25,6 +25,8 @@ cleaner.
 
 import os.path
 import warnings
+import zlib
+from functools import wraps
 
 import numpy
 
@@ -38,6 +40,18 @@ from .. import (DataQualityFlag, DataQualityDict, Segment, SegmentList)
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
+#: names of the columns in the HDF5 representation of a `SegmentList`
+SEGMENT_COLUMNS = ("start_time", "start_time_ns", "end_time", "end_time_ns")
+
+#: default size (in bytes) of the raw data chunk cache used when reading
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+#: maximum number of segments in each chunk of an HDF5 dataset
+MAX_CHUNK_LENGTH = 8192
+
+# number of slots in the chunk cache (should be a prime number)
+_CACHE_NSLOTS = 50021
+
 
 # -- utilities ----------------------------------------------------------------
 
@@ -72,6 +86,30 @@ def find_flag_groups(h5group, strict=True):
     return names
 
 
+def _with_read_chunk_cache(func):
+    """Decorate an HDF5-reading function to open a filepath if needed
+
+    As `gwpy.io.hdf5.with_read_hdf5`, but files are opened with a raw data
+    chunk cache of ``cache_size`` bytes (given as a keyword argument),
+    large enough to hold all of the segments for many flags, so that
+    reading many small datasets from the same file doesn't repeatedly
+    reload the same chunks.
+    """
+    reader = io_hdf5.with_read_hdf5(
+        func,
+        rdcc_nbytes=DEFAULT_CACHE_SIZE,
+        rdcc_nslots=_CACHE_NSLOTS,
+        rdcc_w0=.5,
+    )
+
+    @wraps(func)
+    def decorated_func(fobj, *args, cache_size=DEFAULT_CACHE_SIZE, **kwargs):
+        # pylint: disable=missing-docstring
+        return reader(fobj, *args, rdcc_nbytes=cache_size, **kwargs)
+
+    return decorated_func
+
+
 # -- read ---------------------------------------------------------------------
 
 
@@ -126,7 +164,7 @@ def _get_flag_group(h5f, path):
     )
 
 
-@io_hdf5.with_read_hdf5
+@_with_read_chunk_cache
 def read_hdf5_flag(h5f, path=None, gpstype=LIGOTimeGPS):
     """Read a `DataQualityFlag` object from an HDF5 file or group.
     """
@@ -149,28 +187,41 @@ def read_hdf5_flag(h5f, path=None, gpstype=LIGOTimeGPS):
     return DataQualityFlag(active=active, known=known, **dict(dataset.attrs))
 
 
-@io_hdf5.with_read_hdf5
-def read_hdf5_segmentlist(h5f, path=None, gpstype=LIGOTimeGPS, **kwargs):
+@_with_read_chunk_cache
+def read_hdf5_segmentlist(h5f, path=None, gpstype=LIGOTimeGPS):
     """Read a `SegmentList` object from an HDF5 file or group.
     """
-    from astropy.table import Table
-
     # find dataset
     dataset = io_hdf5.find_dataset(h5f, path=path)
 
-    segtable = Table.read(dataset, format='hdf5', **kwargs)
-    out = SegmentList()
-    for row in segtable:
-        start = LIGOTimeGPS(int(row['start_time']), int(row['start_time_ns']))
-        end = LIGOTimeGPS(int(row['end_time']), int(row['end_time_ns']))
-        if gpstype is LIGOTimeGPS:
-            out.append(Segment(start, end))
-        else:
-            out.append(Segment(gpstype(start), gpstype(end)))
-    return out
+    # read all columns in one go
+    data = dataset[()]
+    columns = [data[name] for name in SEGMENT_COLUMNS]
+
+    # for floats, convert the columns directly, rather than creating
+    # (and then converting) a LIGOTimeGPS for each boundary
+    if gpstype is float:
+        return SegmentList._from_soa(
+            numpy.add(columns[0], columns[1] * 1e-9, dtype=float),
+            numpy.add(columns[2], columns[3] * 1e-9, dtype=float),
+        )
+
+    if gpstype is LIGOTimeGPS:
+        def _segment(start, start_ns, end, end_ns):
+            return Segment(
+                LIGOTimeGPS(start, start_ns),
+                LIGOTimeGPS(end, end_ns),
+            )
+    else:
+        def _segment(start, start_ns, end, end_ns):
+            return Segment(
+                gpstype(LIGOTimeGPS(start, start_ns)),
+                gpstype(LIGOTimeGPS(end, end_ns)),
+            )
+    return SegmentList(map(_segment, *(col.tolist() for col in columns)))
 
 
-@io_hdf5.with_read_hdf5
+@_with_read_chunk_cache
 def read_hdf5_dict(h5f, names=None, path=None, on_missing='error', **kwargs):
     """Read a `DataQualityDict` from an HDF5 file
     """
@@ -301,7 +352,57 @@ def write_hdf5_flag(flag, output, path=None, **kwargs):
     return write_hdf5_dict({path: flag}, output, **kwargs)
 
 
-def write_hdf5_segmentlist(seglist, output, path=None, **kwargs):
+def _segmentlist_to_array(seglist):
+    """Convert a `SegmentList` into a structured array of GPS times
+
+    The columns of the array match those written by
+    :meth:`astropy.table.Table.write`.
+
+    For lists of plain numbers, whole-number boundaries are converted in
+    one go, and only fractional boundaries are converted individually
+    using `~gwpy.time.LIGOTimeGPS`.
+    """
+    data = numpy.zeros((len(seglist), len(SEGMENT_COLUMNS)), dtype=int)
+    if isinstance(seglist, SegmentList) and seglist._exact:
+        bounds = numpy.column_stack(seglist._as_soa())
+        whole = numpy.isfinite(bounds) & (numpy.floor(bounds) == bounds)
+        data[:, ::2] = numpy.where(whole, bounds, 0)
+        for i, j in zip(*numpy.nonzero(~whole)):
+            gps = LIGOTimeGPS(seglist[i][j])
+            data[i, 2*j:2*j+2] = (gps.gpsSeconds, gps.gpsNanoSeconds)
+    else:
+        for i, seg in enumerate(seglist):
+            start, end = map(LIGOTimeGPS, seg)
+            data[i, :] = (start.gpsSeconds, start.gpsNanoSeconds,
+                          end.gpsSeconds, end.gpsNanoSeconds)
+    return data.view([(name, int) for name in SEGMENT_COLUMNS]).ravel()
+
+
+def _write_direct(dset, data, compression=None, compression_opts=None):
+    """Write ``data`` into ``dset`` one chunk at a time
+
+    This bypasses the HDF5 type conversion and filter pipeline, so
+    ``data`` must match the dtype of ``dset`` exactly, and only 'gzip'
+    compression is supported.
+    """
+    length, = dset.chunks
+    for start in range(0, data.size, length):
+        chunk = data[start:start+length]
+        if chunk.size < length:  # HDF5 always stores full chunks
+            chunk = numpy.concatenate((
+                chunk,
+                numpy.zeros(length - chunk.size, dtype=chunk.dtype),
+            ))
+        buffer = chunk.tobytes()
+        if compression == "gzip":
+            buffer = zlib.compress(buffer, 4 if compression_opts is None
+                                   else compression_opts)
+        dset.id.write_direct_chunk((start,), buffer, filter_mask=0)
+
+
+@io_hdf5.with_write_hdf5
+def write_hdf5_segmentlist(seglist, output, path=None, append=False,
+                           overwrite=False, compression=None, **kwargs):
     """Write a `SegmentList` to an HDF5 file/group
 
     Parameters
@@ -315,27 +416,76 @@ def write_hdf5_segmentlist(seglist, output, path=None, **kwargs):
     path : `str`
         path to which to write inside the HDF5 file, relative to ``output``
 
+    append : `bool`, default: `False`
+        if `True`, write new dataset to existing file, otherwise an
+        exception will be raised if the output file exists (only used if
+        ``output`` is `str`)
+
+    overwrite : `bool`, default: `False`
+        if `True` (and ``append=True``), overwrite an existing dataset,
+        otherwise an exception will be raised if a dataset exists with
+        the given name
+
+    compression : `str`, `bool`, optional
+        compression option to pass to :meth:`h5py.Group.create_dataset`,
+        `True` is an alias for ``'gzip'``
+
     **kwargs
         other keyword arguments are passed to
-        :meth:`~astropy.table.Table.write`
+        :meth:`h5py.Group.create_dataset`
+
+    Notes
+    -----
+    The output format matches that of :meth:`astropy.table.Table.write`
+    for a table with columns ``start_time``, ``start_time_ns``,
+    ``end_time``, and ``end_time_ns``.
     """
     if path is None:
         raise ValueError("Please specify the HDF5 path via the "
                          "``path=`` keyword argument")
-
-    from astropy.table import Table
-
-    # convert segmentlist to Table
-    data = numpy.zeros((len(seglist), 4), dtype=int)
-    for i, seg in enumerate(seglist):
-        start, end = map(LIGOTimeGPS, seg)
-        data[i, :] = (start.gpsSeconds, start.gpsNanoSeconds,
-                      end.gpsSeconds, end.gpsNanoSeconds)
-    segtable = Table(data, names=['start_time', 'start_time_ns',
-                                  'end_time', 'end_time_ns'])
-
-    # write table to HDF5
-    return segtable.write(output, path=path, format='hdf5', **kwargs)
+    if path in output and not (append and overwrite):
+        raise IOError("Table {} already exists".format(path))
+    if compression is True:
+        compression = "gzip"
+
+    data = _segmentlist_to_array(seglist)
+
+    # a typical list fits in a single chunk (so is read in one go), while
+    # very long lists use chunks of a few hundred kB
+    if data.size:
+        kwargs.setdefault("chunks", (min(data.size, MAX_CHUNK_LENGTH),))
+
+    # if we can, write the data as raw (or deflated) chunks,
+    # bypassing the HDF5 filter pipeline
+    if (
+        data.size
+        and compression in {None, "gzip"}
+        and not kwargs.keys() - {"chunks", "compression_opts"}
+    ):
+        dset = io_hdf5.create_dataset(
+            output,
+            path,
+            overwrite=True,
+            shape=data.shape,
+            dtype=data.dtype,
+            compression=compression,
+            **kwargs
+        )
+        if dset.chunks is None:  # contiguous layout (chunks=None)
+            dset[()] = data
+        else:
+            _write_direct(dset, data, compression=compression,
+                          compression_opts=kwargs.get("compression_opts"))
+        return dset
+
+    return io_hdf5.create_dataset(
+        output,
+        path,
+        overwrite=True,
+        data=data,
+        compression=compression,
+        **kwargs
+    )
 
 
 # -- register -----------------------------------------------------------------
@@ -22,6 +22,10 @@ gravitational-wave laser interferometer was operating in a specific
 configuration.
 """
 
+from itertools import chain
+
+import numpy
+
 from astropy.io import registry as io_registry
 
 from ligo.segments import (segment, segmentlist, segmentlistdict)
@@ -33,6 +37,148 @@ __author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
 __credits__ = "Kipp Cannon <kipp.cannon@ligo.org>"
 __all__ = ['Segment', 'SegmentList', 'SegmentListDict']
 
+#: types of segment boundaries that can be represented exactly as `float`
+_FLOAT_TYPES = (int, float, numpy.integer, numpy.floating)
+
+#: integer types whose values are only exact as `float` up to a limit
+_INT_TYPES = (int, numpy.integer)
+
+#: magnitude at which integers can no longer be represented exactly
+#: as a (64-bit) `float`
+_MAX_EXACT_INT = 2 ** 53
+
+#: minimum length of `SegmentList` for which to coalesce using numpy,
+#: shorter lists are faster to coalesce using `ligo.segments`
+_COALESCE_NUMPY_MIN = 1000
+
+#: minimum combined length of two `SegmentList` objects for which to
+#: find their union using the compiled `_kernels`
+_KERNELS_MIN = 100
+
+
+# -- utilities ----------------------------------------------------------------
+
+def _is_float_exact(types, bounds):
+    """Returns `True` if ``bounds`` represents a list without rounding
+
+    Lists containing `~gwpy.time.LIGOTimeGPS` (or any other type) cannot
+    be manipulated as `float` arrays without losing precision, nor can
+    lists containing integers of magnitude ``2 ** 53`` or larger.
+
+    Parameters
+    ----------
+    types : `set` of `type`
+        the types of the boundaries in the list
+    bounds : `numpy.ndarray`
+        the boundaries of the list as a `float` array
+    """
+    if not all(issubclass(type_, _FLOAT_TYPES) for type_ in types):
+        return False
+    if any(issubclass(type_, _INT_TYPES) for type_ in types):
+        # any integer that was rounded is now at least 2 ** 53
+        finite = bounds[numpy.isfinite(bounds)]
+        return bool((numpy.abs(finite) < _MAX_EXACT_INT).all())
+    return True
+
+
+def _coalesce_index(starts, ends):
+    """Find the boundaries of the coalesced form of a list of segments
+
+    This function matches the behaviour of
+    :meth:`ligo.segments.segmentlist.coalesce`, including dropping any
+    zero-length segments.
+
+    Parameters
+    ----------
+    starts : `numpy.ndarray`
+        the start of each segment in the list
+    ends : `numpy.ndarray`
+        the end of each segment in the list
+
+    Returns
+    -------
+    lo : `numpy.ndarray`
+        the index of the segment that starts each coalesced segment
+    hi : `numpy.ndarray`
+        the index of the segment that ends each coalesced segment
+    """
+    size = starts.size
+    if not size:
+        return numpy.zeros((2, 0), dtype=int)
+
+    # sort by start, then end
+    order = numpy.lexsort((ends, starts))
+    starts = starts[order]
+    ends = ends[order]
+
+    # a new group starts wherever a segment starts after the running
+    # maximum end time of all segments before it
+    runend = numpy.maximum.accumulate(ends)
+    newgroup = numpy.empty(size, dtype=bool)
+    newgroup[0] = True
+    numpy.greater(starts[1:], runend[:-1], out=newgroup[1:])
+    first = numpy.flatnonzero(newgroup)
+    last = numpy.append(first[1:] - 1, size - 1)
+
+    # find the (sorted) index of the segment that sets the end of each group
+    position = numpy.arange(size)
+    position[ends < runend] = 0
+    last = numpy.maximum.accumulate(position)[last]
+
+    # drop zero-length segments
+    keep = starts[first] != runend[last]
+    return order[first[keep]], order[last[keep]]
+
+
+def _coalesce_numpy(seglist):
+    """Coalesce a list of segments by sorting the boundaries using numpy
+
+    This function returns a new `SegmentList` (rather than modifying
+    ``seglist`` in-place), with the array representation of the coalesced
+    list already cached.
+
+    The original boundary objects are reused in the output, so this
+    function should only be used if `_is_float_exact` is `True` for
+    ``seglist``.
+
+    Parameters
+    ----------
+    seglist : `SegmentList`
+        the list to coalesce
+
+    See also
+    --------
+    _coalesce_index
+        for details of the algorithm
+    """
+    starts, ends = seglist._as_soa()
+    lo, hi = _coalesce_index(starts, ends)
+    # reuse the first segment of each group, then replace those that
+    # were merged with others
+    segs = list(map(seglist.__getitem__, lo.tolist()))
+    for i in numpy.flatnonzero(lo != hi).tolist():
+        segs[i] = Segment(segs[i][0], seglist[hi[i]][1])
+    if not set(map(type, segs)) <= {Segment}:
+        segs = [Segment(a, b) for a, b in segs]
+    new = type(seglist)(segs)
+    new._set_soa(starts[lo], ends[hi], seglist._integer)
+    new._coalesced = True
+    return new
+
+
+def _cached(key, doc):
+    """Create a property for a value in the cached state of a `SegmentList`
+
+    See `SegmentList._state` for details.
+    """
+    def fget(self):
+        return self._state().get(key)
+
+    def fset(self, value):
+        self._state()[key] = value
+
+    return property(fget, fset, doc=doc)
+
 
 class Segment(segment):
     """A tuple defining a semi-open interval ``[start, end)``
@@ -125,6 +271,16 @@ class SegmentList(segmentlist):
      Segment(30, infinity)]
     """
 
+    #: copy of the contents of this list when `_cache` was filled
+    _cache_key = None
+
+    #: cached state of this list, see `SegmentList._state`
+    _cache = None
+
+    _soa = _cached("soa", "cached array representation, see `_as_soa`")
+    _coalesced = _cached("coalesced", "whether this list is coalesced")
+    _livetime = _cached("livetime", "total duration, see `__abs__`")
+
     # -- representations ------------------------
 
     def __repr__(self):
@@ -137,13 +293,323 @@ class SegmentList(segmentlist):
 
     extent = return_as(Segment)(segmentlist.extent)
 
+    # -- array representation -------------------
+
+    def _state(self):
+        """Return the cached state of this list as a `dict`
+
+        The cache is discarded whenever the contents of this list no longer
+        match the copy taken when it was filled, so in-place modifications
+        (including those made by `ligo.segments` itself) need no special
+        handling, and only the methods that use the cache pay for the check.
+        """
+        key = self._cache_key
+        if key is None or not list.__eq__(self, key):
+            self._cache_key = list(self)
+            self._cache = {}
+        return self._cache
+
+    def _as_soa(self):
+        """Return the boundaries of this list as a pair of `float` arrays
+
+        The arrays are cached until this list is next modified in-place,
+        and are marked read-only to protect the cache.
+
+        Returns
+        -------
+        starts : `numpy.ndarray`
+            the start of each segment in this list
+        ends : `numpy.ndarray`
+            the end of each segment in this list
+        """
+        state = self._state()
+        if "soa" not in state:
+            self._fill_soa(state)
+        return state["soa"]
+
+    def _fill_soa(self, state, check=False):
+        """Fill the array representation of this list in ``state``
+
+        If ``check=True`` the boundaries are only converted if the list
+        is `_exact`, otherwise only ``state["exact"]`` is set.
+        """
+        # a list containing any other type usually contains nothing else,
+        # so check the first boundary before scanning them all
+        if check and self and not isinstance(self[0][0], _FLOAT_TYPES):
+            state["exact"] = state["integer"] = False
+            return
+        flat = list(chain.from_iterable(self))
+        types = set(map(type, flat))
+        if check and not all(
+            issubclass(type_, _FLOAT_TYPES) for type_ in types
+        ):
+            state["exact"] = state["integer"] = False
+            return
+        bounds = numpy.array(flat, dtype=float).reshape(-1, 2)
+        starts, ends = numpy.ascontiguousarray(bounds.T)
+        starts.flags.writeable = ends.flags.writeable = False
+        state["soa"] = (starts, ends)
+        if "exact" not in state:
+            state["exact"] = _is_float_exact(types, bounds)
+            state["integer"] = state["exact"] and all(
+                issubclass(type_, _INT_TYPES) for type_ in types
+            )
+
+    @property
+    def _starts(self):
+        """The start of each segment in this list as a `float` array
+        """
+        return self._as_soa()[0]
+
+    @property
+    def _ends(self):
+        """The end of each segment in this list as a `float` array
+        """
+        return self._as_soa()[1]
+
+    @property
+    def _exact(self):
+        """`True` if `_as_soa` represents this list without loss of precision
+
+        This is `False` if any boundary is not a plain `int` or `float`,
+        e.g. a `~gwpy.time.LIGOTimeGPS`, in which case the boundaries are
+        not converted.
+        """
+        state = self._state()
+        if "exact" not in state:
+            self._fill_soa(state, check=True)
+        return state["exact"]
+
+    @property
+    def _integer(self):
+        """`True` if `_exact` is `True` and all boundaries are integers
+        """
+        return self._exact and self._state()["integer"]
+
+    @classmethod
+    def _from_soa(cls, starts, ends):
+        """Create a new `SegmentList` from arrays of boundaries
+
+        As with `Segment`, the boundaries of each new segment are sorted.
+        """
+        starts, ends = numpy.minimum(starts, ends), numpy.maximum(starts, ends)
+        new = cls(map(Segment, starts.tolist(), ends.tolist()))
+        new._set_soa(starts, ends, integer=False)
+        return new
+
+    def _set_soa(self, starts, ends, integer):
+        """Cache the array representation of this (exact) list
+        """
+        starts.flags.writeable = ends.flags.writeable = False
+        self._state().update(soa=(starts, ends), exact=True, integer=integer)
+
+    def _inherit_cache(self, other):
+        """Copy the cached state of ``other``, which must hold equal segments
+        """
+        self._cache_key = list(self)
+        self._cache = dict(other._state())
+        return self
+
+    # -- arithmetic -----------------------------
+
+    def _use_kernels(self, other):
+        """Returns `True` if the union with ``other`` can use `_kernels`
+
+        This is only faster than `ligo.segments` if the array form of
+        both lists is already cached, so that is required here; that is the
+        case for lists coalesced using numpy, read from HDF5 as `float`,
+        or returned by `contract`, `protract`, or a previous union.
+        """
+        if not (
+            isinstance(other, SegmentList)
+            and self._coalesced
+            and other._coalesced
+            and len(self) + len(other) > _KERNELS_MIN
+            and self._soa is not None
+            and other._soa is not None
+            and self._exact
+            and other._exact
+        ):
+            return False
+        from . import _kernels  # importing numba is slow
+        return _kernels.HAS_NUMBA
+
+    def _union_kernel(self, other):
+        """Find the union of this list and ``other`` using `_kernels`
+
+        The boundaries of the new list are the original boundary objects of
+        ``self`` and ``other``, as indexed by the kernel, and any segment
+        that is passed through unchanged is reused.
+        """
+        from . import _kernels
+        s1, e1 = self._as_soa()
+        s2, e2 = other._as_soa()
+        lo, hi = _kernels.union_sorted(s1, e1, s2, e2)
+        segs = list(chain(self, other))
+        new = type(self)(
+            segs[a >> 1] if (not a & 1 and b == a + 1) else
+            Segment(segs[a >> 1][a & 1], segs[b >> 1][b & 1])
+            for a, b in zip(lo.tolist(), hi.tolist())
+        )
+        flat = numpy.concatenate((
+            numpy.column_stack((s1, e1)).ravel(),
+            numpy.column_stack((s2, e2)).ravel(),
+        ))
+        new._set_soa(flat[lo], flat[hi], self._integer and other._integer)
+        new._coalesced = True
+        return new
+
+    def _use_search(self, other):
+        """Returns `True` if ``other`` is short enough for `_intersect_small`
+
+        That is, if ``len(other)`` is less than ``log2(len(self))``.
+        As for `_use_kernels`, the array form of both lists must already
+        be cached, building it costs more than the search saves.
+        """
+        return (
+            isinstance(other, SegmentList)
+            and len(other) < len(self).bit_length() - 1
+            and self._coalesced
+            and other._coalesced
+            and self._soa is not None
+            and other._soa is not None
+            and self._exact
+            and other._exact
+        )
+
+    def _intersect_small(self, other):
+        """Intersect this list with a much shorter list
+
+        The segments of this list that overlap each segment in ``other``
+        are found using a binary search of the boundary arrays, so only
+        the overlapping segments are visited.
+        """
+        starts, ends = self._as_soa()
+        ostarts, oends = other._as_soa()
+        first = numpy.searchsorted(ends, ostarts, side='right').tolist()
+        last = numpy.searchsorted(starts, oends, side='left').tolist()
+        out = []
+        for (start, end), i, j in zip(other, first, last):
+            if i >= j:  # no overlap
+                continue
+            overlap = self[i:j]
+            # clip the first and last overlapping segments
+            if overlap[0][0] < start:
+                overlap[0] = Segment(start, overlap[0][1])
+            if overlap[-1][1] > end:
+                overlap[-1] = Segment(overlap[-1][0], end)
+            out.extend(overlap)
+        new = type(self)(out)
+        new._coalesced = True
+        return new
+
+    @classmethod
+    def _union_all(cls, seglists):
+        """Return the union of any number of lists as a new `SegmentList`
+
+        All segments are gathered into a single list and coalesced once,
+        rather than combining the lists pairwise. If all lists are exact,
+        their cached arrays are concatenated to seed the new list's cache.
+        """
+        seglists = list(seglists)
+        new = cls(chain.from_iterable(seglists))
+        if seglists and all(
+            isinstance(x, SegmentList) and x._exact for x in seglists
+        ):
+            starts = numpy.concatenate([x._starts for x in seglists])
+            ends = numpy.concatenate([x._ends for x in seglists])
+            new._set_soa(starts, ends, all(x._integer for x in seglists))
+        return new.coalesce()
+
+    def __and__(self, other):
+        if self._use_search(other):
+            return self._intersect_small(other)
+        return super().__and__(other)
+
+    def __or__(self, other):
+        if self._use_kernels(other):
+            return self._union_kernel(other)
+        return super().__or__(other)
+
+    def __iand__(self, other):
+        if self._use_search(other):
+            new = self._intersect_small(other)
+            self[:] = new
+            return self._inherit_cache(new)
+        return super().__iand__(other)
+
+    def __ior__(self, other):
+        if self._use_kernels(other):
+            new = self._union_kernel(other)
+            self[:] = new
+            return self._inherit_cache(new)
+        return super().__ior__(other)
+
     def coalesce(self):
+        # (_exact checks the boundary types before converting anything)
+        if len(self) > _COALESCE_NUMPY_MIN and self._exact:
+            new = _coalesce_numpy(self)
+            self[:] = new
+            return self._inherit_cache(new)
         super().coalesce()
-        for i, seg in enumerate(self):
-            self[i] = Segment(seg[0], seg[1])
+        # only merged segments need to be cast
+        self[:] = [
+            seg if type(seg) is Segment else Segment(seg[0], seg[1])
+            for seg in self
+        ]
+        self._coalesced = True
         return self
     coalesce.__doc__ = segmentlist.coalesce.__doc__
 
+    def _pad_soa(self, start, end):
+        """Pad each segment in this list using the array representation
+
+        Inverted segments are reversed (as for `Segment`), and the list is
+        coalesced in-place.
+        """
+        starts, ends = self._as_soa()
+        starts, ends = starts + start, ends + end
+        starts, ends = numpy.minimum(starts, ends), numpy.maximum(starts, ends)
+        lo, hi = _coalesce_index(starts, ends)
+        new = self._from_soa(starts[lo], ends[hi])
+        self[:] = new
+        self._inherit_cache(new)._coalesced = True
+        return self
+
+    def contract(self, x):
+        if isinstance(x, float) and self._exact:
+            return self._pad_soa(x, -x)
+        return super().contract(x)
+    contract.__doc__ = segmentlist.contract.__doc__
+
+    def protract(self, x):
+        if isinstance(x, float) and self._exact:
+            return self._pad_soa(-x, x)
+        return super().protract(x)
+    protract.__doc__ = segmentlist.protract.__doc__
+
+    def __abs__(self):
+        """Return the sum of the durations of all segments in this list
+
+        The result is cached until this list is next modified in-place.
+        """
+        state = self._state()
+        if state.get("livetime") is None:
+            livetime = None
+            # only use the arrays if they are already cached, converting
+            # the list just for this is slower than summing the segments
+            if "soa" in state and state["exact"]:
+                starts, ends = state["soa"]
+                livetime = float(numpy.subtract(ends, starts).sum())
+                # keep the type of integer boundaries, if the sum is exact
+                if state["integer"]:
+                    livetime = (int(livetime) if livetime < _MAX_EXACT_INT
+                                else None)
+            if livetime is None:
+                livetime = super().__abs__()
+            state["livetime"] = livetime
+        return state["livetime"]
+
     def to_table(self):
         """Convert this `SegmentList` to a `~astropy.table.Table`
 
@@ -182,6 +648,11 @@ class SegmentList(segmentlist):
             if `True` coalesce the segment list before returning,
             otherwise return exactly as contained in file(s).
 
+        cache_size : `int`, optional
+            size (in bytes) of the raw data chunk cache to use when
+            opening HDF5 files, defaults to 64 MiB, only used for
+            ``format='hdf5'``
+
         **kwargs
             other keyword arguments depend on the format, see the online
             documentation for details (:ref:`gwpy-segments-io`)
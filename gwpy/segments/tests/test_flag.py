@@ -22,6 +22,7 @@
 
 import re
 import warnings
+from functools import lru_cache
 from io import BytesIO
 from unittest import mock
 from urllib.error import HTTPError
@@ -69,6 +70,13 @@ VETO_DEFINER_FILE = """
 """.strip()  # noqa: E501
 
 
+@pytest.fixture(scope="module")
+def tmp_dir(tmp_path_factory):
+    """A temporary directory shared by all tests in this module
+    """
+    return tmp_path_factory.mktemp("test_flag")
+
+
 @pytest.fixture
 def veto_definer(tmp_path):
     tmp = tmp_path / "veto-definer.xml"
@@ -143,8 +151,30 @@ QUERY_RESULT['Y1:TEST-FLAG2:4'] = DataQualityFlag(
     known=[(0, 5), (9, 10)],
     active=[])
 
-QUERY_RESULTC = type(QUERY_RESULT)({x: y.copy().coalesce() for
-                                    x, y in QUERY_RESULT.items()})
+
+@pytest.fixture(scope="module")
+def query_resultc():
+    """The coalesced form of `QUERY_RESULT`
+
+    This is created once, and shared by all tests in this module,
+    so should not be modified.
+    """
+    return type(QUERY_RESULT)({x: y.copy().coalesce() for
+                               x, y in QUERY_RESULT.items()})
+
+
+@lru_cache()
+def _query_payload(flag, start, end):
+    """Return the ``(known, active)`` segment tuples for a mock query
+
+    Each query is only computed once, and shared by all tests in this
+    module, so the returned lists should not be modified.
+    """
+    span = SegmentList([Segment(start, end)])
+    return (
+        list(map(tuple, QUERY_RESULT[flag].known & span)),
+        list(map(tuple, QUERY_RESULT[flag].active & span)),
+    )
 
 
 def mock_query_segments(flag, start, end, **kwargs):
@@ -154,18 +184,18 @@ def mock_query_segments(flag, start, end, **kwargs):
     except ValueError:
         ifo, name = flag.split(':', 1)
         version = None
-    span = SegmentList([Segment(start, end)])
     reflag = re.compile(flag)
     try:
         actual = list(filter(reflag.match, QUERY_RESULT))[0]
     except IndexError:
         raise HTTPError('test-url/', 404, 'Not found', None, None)
+    known, active = _query_payload(actual, start, end)
     return {
         'ifo': ifo,
         'name': name,
         'version': version,
-        'known': list(map(tuple, QUERY_RESULT[actual].known & span)),
-        'active': list(map(tuple, QUERY_RESULT[actual].active & span)),
+        'known': known,
+        'active': active,
         'query_information': {},
         'metadata': kwargs,
     }
@@ -358,6 +388,9 @@ class TestDataQualityFlag(object):
         utils.assert_segmentlist_equal(r.known, KNOWN)
         utils.assert_segmentlist_equal(r.active, KNOWNACTIVE)
 
+        # check that integer boundaries are left as integers
+        assert all(type(x) is int for seg in r.known for x in seg)
+
     def test_pad(self, flag):
         # test with no arguments (and no padding)
         padded = flag.pad()
@@ -378,6 +411,8 @@ class TestDataQualityFlag(object):
         # test in-place
         padded = flag.pad(*PADDING)
         assert padded is not flag
+        utils.assert_segmentlist_equal(flag.known, KNOWN)
+        utils.assert_segmentlist_equal(flag.active, ACTIVE)
         padded = flag.pad(*PADDING, inplace=True)
         assert padded is flag
         utils.assert_segmentlist_equal(flag.known, KNOWNPAD)
@@ -415,11 +450,11 @@ class TestDataQualityFlag(object):
         assert f.version is None
 
     @mock.patch("gwpy.segments.flag.query_segments", mock_query_segments)
-    def test_populate(self):
+    def test_populate(self, query_resultc):
         name = QUERY_FLAGS[0]
         flag = self.TEST_CLASS(name, known=QUERY_RESULT[name].known)
         flag.populate()
-        utils.assert_flag_equal(flag, QUERY_RESULTC[name])
+        utils.assert_flag_equal(flag, query_resultc[name])
 
     # -- test I/O -------------------------------
 
@@ -428,7 +463,7 @@ class TestDataQualityFlag(object):
         ('hdf5', 'h5', {'path': 'test-dqflag'}, False),
         ('json', 'json', {}, True),
     ])
-    def test_read_write(self, flag, format, ext, rw_kwargs, simple):
+    def test_read_write(self, flag, tmp_dir, format, ext, rw_kwargs, simple):
         # simplify calling read/write tester
         def _read_write(**kwargs):
             read_kw = rw_kwargs.copy()
@@ -438,7 +473,7 @@ class TestDataQualityFlag(object):
             return utils.test_read_write(flag, format, extension=ext,
                                          assert_equal=utils.assert_flag_equal,
                                          read_kw=read_kw, write_kw=write_kw,
-                                         **kwargs)
+                                         tmp_path=tmp_dir, **kwargs)
 
         # perform simple test
         if simple:
@@ -492,10 +527,10 @@ class TestDataQualityFlag(object):
     # -- test queries ---------------------------
 
     @mock.patch("gwpy.segments.flag.query_segments", mock_query_segments)
-    def test_query(self):
+    def test_query(self, query_resultc):
         result = self.TEST_CLASS.query(QUERY_FLAGS[0], 0, 10)
         assert isinstance(result, self.TEST_CLASS)
-        RESULT = QUERY_RESULT[QUERY_FLAGS[0]].copy().coalesce()
+        RESULT = query_resultc[QUERY_FLAGS[0]]
         utils.assert_segmentlist_equal(result.known, RESULT.known)
         utils.assert_segmentlist_equal(result.active, RESULT.active)
 
@@ -504,10 +539,10 @@ class TestDataQualityFlag(object):
         (QUERY_FLAGS[0].rsplit(':', 1)[0], QUERY_FLAGS[0]),  # versionless
     ])
     @mock.patch('gwpy.segments.flag.query_segments', mock_query_segments)
-    def test_query_dqsegdb(self, name, flag):
+    def test_query_dqsegdb(self, query_resultc, name, flag):
         # standard query
         result = self.TEST_CLASS.query_dqsegdb(name, 0, 10)
-        RESULT = QUERY_RESULTC[flag]
+        RESULT = query_resultc[flag]
         assert isinstance(result, self.TEST_CLASS)
         utils.assert_segmentlist_equal(result.known, RESULT.known)
         utils.assert_segmentlist_equal(result.active, RESULT.active)
@@ -539,10 +574,10 @@ class TestDataQualityFlag(object):
             self.TEST_CLASS.query_dqsegdb(QUERY_FLAGS[0], (1, 2, 3))
 
     @mock.patch('gwpy.segments.flag.query_segments', mock_query_segments)
-    def test_query_dqsegdb_multi(self):
+    def test_query_dqsegdb_multi(self, query_resultc):
         segs = SegmentList([Segment(0, 2), Segment(8, 10)])
         result = self.TEST_CLASS.query_dqsegdb(QUERY_FLAGS[0], segs)
-        RESULT = QUERY_RESULTC[QUERY_FLAGS[0]]
+        RESULT = query_resultc[QUERY_FLAGS[0]]
 
         assert isinstance(result, self.TEST_CLASS)
         utils.assert_segmentlist_equal(result.known, RESULT.known & segs)
@@ -698,7 +733,8 @@ class TestDataQualityDict(object):
         ('hdf5', 'h5', 'h5py', {}),
         ('hdf5', 'hdf5', 'h5py', {'path': 'test-dqdict'}),
     ])
-    def test_read_write(self, instance, format, ext, dep, rw_kwargs):
+    def test_read_write(self, instance, tmp_dir, format, ext, dep,
+                        rw_kwargs):
         # define assertion
         def _assert(a, b):
             return utils.assert_dict_equal(a, b, utils.assert_flag_equal)
@@ -712,13 +748,20 @@ class TestDataQualityDict(object):
             return utils.test_read_write(instance, format, extension=ext,
                                          assert_equal=_assert,
                                          read_kw=read_kw, write_kw=write_kw,
-                                         **kwargs)
+                                         tmp_path=tmp_dir, **kwargs)
 
         _read_write(autoidentify=False)
         with pytest.raises(IOError):
             _read_write(autoidentify=True)
         _read_write(autoidentify=True, write_kw={'overwrite': True})
 
+    @pytest.mark.parametrize('cache_size', (0, 1024 ** 2))
+    def test_read_hdf5_cache_size(self, instance, tmp_path, cache_size):
+        tmp = tmp_path / "test.h5"
+        instance.write(tmp)
+        new = self.TEST_CLASS.read(tmp, format="hdf5", cache_size=cache_size)
+        utils.assert_dict_equal(new, instance, utils.assert_flag_equal)
+
     @pytest.mark.requires("ligo.lw.lsctables")
     def test_read_write_ligolw(self, instance):
         def _assert(a, b):
@@ -776,17 +819,17 @@ class TestDataQualityDict(object):
     # -- test queries ---------------------------
 
     @mock.patch('gwpy.segments.flag.query_segments', mock_query_segments)
-    def test_query(self):
+    def test_query(self, query_resultc):
         result = self.TEST_CLASS.query(QUERY_FLAGS, 0, 10)
-        RESULT = QUERY_RESULT.copy().coalesce()
+        RESULT = query_resultc
 
         assert isinstance(result, self.TEST_CLASS)
         utils.assert_dict_equal(result, RESULT, utils.assert_flag_equal)
 
     @mock.patch('gwpy.segments.flag.query_segments', mock_query_segments)
-    def test_query_dqsegdb(self):
+    def test_query_dqsegdb(self, query_resultc):
         result = self.TEST_CLASS.query_dqsegdb(QUERY_FLAGS, 0, 10)
-        RESULT = QUERY_RESULTC
+        RESULT = query_resultc
         assert isinstance(result, self.TEST_CLASS)
         utils.assert_dict_equal(result, RESULT, utils.assert_flag_equal)
 
@@ -802,7 +845,7 @@ class TestDataQualityDict(object):
             self.TEST_CLASS.query_dqsegdb(QUERY_FLAGS, 0, 10, on_error='blah')
 
     @mock.patch('gwpy.segments.flag.query_segments', mock_query_segments)
-    def test_populate(self):
+    def test_populate(self, query_resultc):
         def fake():
             return self.TEST_CLASS({
                 x: self.ENTRY_CLASS(name=x, known=y.known) for
@@ -835,17 +878,17 @@ class TestDataQualityDict(object):
             vdf.populate(on_error='blah')
 
         # check basic populate worked
-        utils.assert_dict_equal(vdf, QUERY_RESULTC, utils.assert_flag_equal)
+        utils.assert_dict_equal(vdf, query_resultc, utils.assert_flag_equal)
 
         # check padded populate worked
-        utils.assert_flag_equal(vdf2[flag], QUERY_RESULTC[flag].pad(-1, 1))
+        utils.assert_flag_equal(vdf2[flag], query_resultc[flag].pad(-1, 1))
 
         # check segment-restricted populate worked
         for flag in vdf3:
             utils.assert_segmentlist_equal(
-                vdf3[flag].known, QUERY_RESULTC[flag].known & span)
+                vdf3[flag].known, query_resultc[flag].known & span)
             utils.assert_segmentlist_equal(
-                vdf3[flag].active, QUERY_RESULTC[flag].active & span)
+                vdf3[flag].active, query_resultc[flag].active & span)
 
     def test_coalesce(self):
         instance = self.create()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Cardiff University (2023)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for :mod:`gwpy.segments._kernels`
+"""
+
+import operator
+
+import numpy
+import pytest
+
+from ligo import segments as ligo_segments
+
+from ...testing.utils import assert_segmentlist_equal
+from .. import (Segment, SegmentList, segments as gwpy_segments, _kernels)
+
+SEGS1 = [(0, 2), (3, 5), (6, 10), (12, 13), (16, 17.5)]
+SEGS2 = [(1, 3), (4, 7), (9, 10), (11, 12), (14, 15), (17.5, 20)]
+
+SEGMENTS = pytest.mark.parametrize("a, b", [
+    (SEGS1, SEGS2),
+    (SEGS2, SEGS1),
+    (SEGS1, SEGS1),
+    (SEGS1, []),
+    ([], SEGS1),
+    ([(0, 100)], SEGS1),
+])
+
+
+def _ligo_segmentlist(segs):
+    return ligo_segments.segmentlist(
+        ligo_segments.segment(a, b) for a, b in segs
+    )
+
+
+@SEGMENTS
+def test_union_sorted(a, b):
+    a = numpy.array(a, dtype=float).reshape(-1, 2)
+    b = numpy.array(b, dtype=float).reshape(-1, 2)
+    lo, hi = _kernels.union_sorted(a[:, 0], a[:, 1], b[:, 0], b[:, 1])
+    bounds = numpy.concatenate((a.ravel(), b.ravel()))
+    assert_segmentlist_equal(
+        list(zip(bounds[lo], bounds[hi])),
+        _ligo_segmentlist(a) | _ligo_segmentlist(b),
+    )
+
+
+@SEGMENTS
+def test_segmentlist_union(monkeypatch, a, b):
+    """Test that `SegmentList` union using the kernels works
+    """
+    # force use of kernels, even if numba isn't available
+    monkeypatch.setattr(_kernels, "HAS_NUMBA", True)
+    monkeypatch.setattr(gwpy_segments, "_KERNELS_MIN", 0)
+
+    x = SegmentList(Segment(*seg) for seg in a).coalesce()
+    y = SegmentList(Segment(*seg) for seg in b).coalesce()
+    expected = _ligo_segmentlist(a) | _ligo_segmentlist(b)
+
+    # check that the kernels are only used with cached arrays
+    assert not x._use_kernels(y)
+    x._as_soa()
+    y._as_soa()
+    assert x._use_kernels(y)
+
+    # check normal operator
+    result = x | y
+    assert isinstance(result, SegmentList)
+    assert_segmentlist_equal(result, expected)
+    assert all(isinstance(seg, Segment) for seg in result)
+    assert result._coalesced
+    assert result._starts.tolist() == [seg[0] for seg in expected]
+    assert result._ends.tolist() == [seg[1] for seg in expected]
+
+    # check in-place operator
+    result = operator.ior(x, y)
+    assert result is x
+    assert_segmentlist_equal(x, expected)
+    assert x._coalesced
+    assert x._starts.tolist() == [seg[0] for seg in expected]
+
+
+def test_segmentlist_union_coalesced(monkeypatch):
+    """Test that the kernels are used for long lists coalesced using numpy
+    """
+    monkeypatch.setattr(_kernels, "HAS_NUMBA", True)
+
+    a = [(i, i + 1) for i in range(0, 3000, 2)]
+    b = [(i + .5, i + 1.5) for i in range(0, 4500, 3)]
+    x = SegmentList(Segment(*seg) for seg in a).coalesce()
+    y = SegmentList(Segment(*seg) for seg in b).coalesce()
+    assert x._use_kernels(y)
+    assert_segmentlist_equal(
+        x | y,
+        _ligo_segmentlist(a) | _ligo_segmentlist(b),
+    )
@@ -19,12 +19,15 @@
 """Tests for :mod:`gwpy.segments.segments`
 """
 
+import numpy
 import pytest
 
 import h5py
 
 from astropy.table import Table
 
+from ligo import segments as ligo_segments
+
 from ...testing.utils import (
     assert_segmentlist_equal,
     assert_table_equal
@@ -83,7 +86,177 @@ class TestSegmentList(object):
         c = segmentlist.coalesce()
         assert c is segmentlist
         assert_segmentlist_equal(c, [(1, 2), (3, 5)])
+        assert all(isinstance(seg, self.ENTRY_CLASS) for seg in c)
+        assert c._coalesced
+
+    def test_coalesce_large(self):
+        """Test that coalescing a long list matches `ligo.segments`
+        """
+        segs = [(i, i + 2) for i in range(0, 2000, 3)]  # disjoint
+        segs += [(i, i + 2) for i in range(1, 2000, 6)]  # overlapping
+        segs += [(i + .5, i + .5) for i in range(0, 2000, 7)]  # zero-length
+        segmentlist = self.create(*segs[::-1])
+        c = segmentlist.coalesce()
+        assert c is segmentlist
+        assert_segmentlist_equal(
+            c,
+            ligo_segments.segmentlist(
+                ligo_segments.segment(a, b) for a, b in segs
+            ).coalesce(),
+        )
         assert isinstance(c[0], self.ENTRY_CLASS)
+        assert isinstance(c[0][0], int)
+
+        # check that the coalesced arrays are kept
+        assert c._coalesced
+        assert c._soa is not None
+        assert c._starts.tolist() == [seg[0] for seg in c]
+        assert c._ends.tolist() == [seg[1] for seg in c]
+
+    @pytest.mark.parametrize("method", ("contract", "protract"))
+    @pytest.mark.parametrize("x", (.5, -.5, 1))
+    def test_contract_protract(self, method, x):
+        """Test that `contract` and `protract` match `ligo.segments`
+        """
+        segs = [(i, i + 1.5) for i in range(0, 100, 2)] + [(49.5, 49.7)]
+        segmentlist = self.create(*segs)
+        result = getattr(segmentlist, method)(x)
+        assert result is segmentlist
+        assert_segmentlist_equal(
+            result,
+            getattr(ligo_segments.segmentlist(
+                ligo_segments.segment(a, b) for a, b in segs
+            ), method)(x),
+        )
+        assert isinstance(result[0], self.ENTRY_CLASS)
+        assert result._starts.tolist() == [seg[0] for seg in result]
+
+    def test_and_small(self):
+        """Test that intersecting with a short list matches `ligo.segments`
+        """
+        segs = [(i, i + 1.5) for i in range(0, 100, 2)]
+        small = [(-1, 2.5), (9.75, 10.25), (20, 30), (101, 102)]
+        segmentlist = self.create(*segs).coalesce()
+        other = self.create(*small).coalesce()
+
+        # check that the search is only used with cached arrays
+        assert not segmentlist._use_search(other)
+        segmentlist._as_soa()
+        other._as_soa()
+        assert segmentlist._use_search(other)
+        expected = (
+            ligo_segments.segmentlist(
+                ligo_segments.segment(a, b) for a, b in segs
+            ) & ligo_segments.segmentlist(
+                ligo_segments.segment(a, b) for a, b in small
+            )
+        )
+        result = segmentlist & other
+        assert_segmentlist_equal(result, expected)
+        assert all(isinstance(seg, self.ENTRY_CLASS) for seg in result)
+        segmentlist &= other
+        assert_segmentlist_equal(segmentlist, expected)
+        assert segmentlist._starts.tolist() == [seg[0] for seg in expected]
+
+    @pytest.mark.parametrize("gpstype", (int, LIGOTimeGPS))
+    def test_union_all(self, gpstype):
+        """Test that `SegmentList._union_all` matches a pairwise union
+        """
+        lists = [
+            [(0, 2), (4, 6)],
+            [(1, 3), (8, 9)],
+            [],
+            [(5, 8), (10, 12)],
+        ]
+        expected = ligo_segments.segmentlist()
+        for segs in lists:
+            expected |= ligo_segments.segmentlist(
+                ligo_segments.segment(a, b) for a, b in segs
+            )
+        result = self.TEST_CLASS._union_all(
+            self.create(*(map(gpstype, seg) for seg in segs))
+            for segs in lists
+        )
+        assert isinstance(result, self.TEST_CLASS)
+        assert_segmentlist_equal(result, expected)
+        assert all(isinstance(seg, self.ENTRY_CLASS) for seg in result)
+        assert result._coalesced
+        assert result._starts.tolist() == [seg[0] for seg in expected]
+
+    def test_as_soa(self, segmentlist):
+        starts, ends = segmentlist._as_soa()
+        assert starts.dtype == ends.dtype == float
+        assert starts.tolist() == [1, 3, 4, 8]
+        assert ends.tolist() == [2, 4, 6, 10]
+        assert segmentlist._exact is True
+
+        # check that the arrays are cached (and protected)
+        assert segmentlist._starts is starts
+        with pytest.raises(ValueError):
+            starts[0] = 0
+
+        # check that in-place modifications clear the cache
+        segmentlist.append(self.ENTRY_CLASS(20, 30))
+        assert segmentlist._ends.tolist() == [2, 4, 6, 10, 30]
+        segmentlist.coalesce()
+        assert segmentlist._starts.tolist() == [1, 3, 8, 20]
+        segmentlist &= self.create((0, 9))
+        assert segmentlist._ends.tolist() == [2, 6, 9]
+        segmentlist[0] = self.ENTRY_CLASS(0, 2)
+        assert segmentlist._starts.tolist() == [0, 3, 8]
+        segmentlist.shift(1)
+        assert segmentlist._starts.tolist() == [1, 4, 9]
+
+    def test_as_soa_ligotimegps(self):
+        segmentlist = self.create((LIGOTimeGPS(1, 5), LIGOTimeGPS(2)))
+        assert segmentlist._starts.tolist() == [1.000000005]
+        assert segmentlist._exact is False
+
+    def test_as_soa_large_int(self):
+        """Test that integers beyond 2 ** 53 are not treated as exact
+        """
+        big = 2 ** 53
+        segmentlist = self.create((big, big + 1))
+        assert segmentlist._exact is False
+        assert abs(segmentlist) == 1
+        assert self.create((0, big - 1))._exact is True
+        assert self.create((0, 1), (2, float("inf")))._exact is True
+
+        # check that a long list is not coalesced using rounded boundaries
+        segs = [(i, i + 1) for i in range(0, 3000, 2)]
+        segs += [(big, big + 1), (big + 2, big + 5)]
+        segmentlist = self.create(*segs).coalesce()
+        assert segmentlist[-2:] == [(big, big + 1), (big + 2, big + 5)]
+
+    def test_from_soa(self):
+        segmentlist = self.TEST_CLASS._from_soa(
+            numpy.array([1., 3., 6.]),
+            numpy.array([2., 4., 5.]),
+        )
+        assert isinstance(segmentlist, self.TEST_CLASS)
+        assert isinstance(segmentlist[0], self.ENTRY_CLASS)
+        assert_segmentlist_equal(segmentlist, [(1, 2), (3, 4), (5, 6)])
+        assert segmentlist._starts.tolist() == [1, 3, 5]
+
+    def test_abs(self, segmentlist):
+        livetime = abs(segmentlist)
+        assert livetime == 6
+        assert type(livetime) is int
+        assert segmentlist._livetime == livetime
+        assert segmentlist._soa is None  # arrays not built just for this
+        assert type(abs(self.create((0, 1.5)))) is float
+
+        # check that in-place modifications clear the cache
+        segmentlist.coalesce()
+        assert abs(segmentlist) == 6.
+        segmentlist.append(self.ENTRY_CLASS(20, 30))
+        assert abs(segmentlist) == 16.
+        segmentlist -= self.create((0, 2))
+        assert abs(segmentlist) == 15.
+
+    def test_abs_ligotimegps(self):
+        segmentlist = self.create((LIGOTimeGPS(1, 5), LIGOTimeGPS(2)))
+        assert abs(segmentlist) == LIGOTimeGPS(0, 999999995)
 
     def test_to_table(self, segmentlist):
         segtable = segmentlist.to_table()
@@ -146,6 +319,10 @@ class TestSegmentList(object):
         sl2 = self.TEST_CLASS.read(tmp, path='test-segmentlist')
         assert_segmentlist_equal(sl2, segmentlist)
 
+        # check the chunk cache can be configured
+        sl2 = self.TEST_CLASS.read(tmp, cache_size=0)
+        assert_segmentlist_equal(sl2, segmentlist)
+
         # check we can read directly from the h5 object
         with h5py.File(tmp, "r") as h5f:
             sl2 = self.TEST_CLASS.read(h5f["test-segmentlist"])
@@ -160,3 +337,52 @@ class TestSegmentList(object):
         sl2 = self.TEST_CLASS.read(tmp, gpstype=float)
         assert_segmentlist_equal(sl2, segmentlist)
         assert isinstance(sl2[0][0], float)
+
+    @pytest.mark.parametrize("segments", [
+        [(-5, 3), (4, 7)],  # integer
+        [(-2.25, -1.), (1.5, 2), (1e9 + .5, 1e9 + 1)],  # fractional
+        [(LIGOTimeGPS(1, 5), LIGOTimeGPS(2))],  # LIGOTimeGPS
+    ])
+    def test_read_write_hdf5_gps(self, tmp_path, segments):
+        """Test that boundaries of any type are written as exact GPS times
+        """
+        segmentlist = self.create(*segments)
+        tmp = tmp_path / "segments.h5"
+        segmentlist.write(tmp, "test-segmentlist")
+        sl2 = self.TEST_CLASS.read(tmp)
+        assert [tuple(map(LIGOTimeGPS, seg)) for seg in segmentlist] == sl2
+
+    @pytest.mark.parametrize('compression', (None, 'gzip', 'lzf'))
+    def test_write_hdf5_compression(self, segmentlist, tmp_path, compression):
+        tmp = tmp_path / "segments.h5"
+        segmentlist.write(tmp, 'test-segmentlist', compression=compression)
+        with h5py.File(tmp, "r") as h5f:
+            assert h5f["test-segmentlist"].compression == compression
+        assert_segmentlist_equal(self.TEST_CLASS.read(tmp), segmentlist)
+        assert_table_equal(
+            Table.read(tmp, path='test-segmentlist'),
+            Table(
+                rows=[(a, 0, b, 0) for a, b in segmentlist],
+                names=('start_time', 'start_time_ns',
+                       'end_time', 'end_time_ns'),
+            ),
+        )
+
+    @pytest.mark.parametrize('compression', (None, 'gzip'))
+    def test_write_hdf5_chunks(self, tmp_path, compression):
+        from ..io.hdf5 import MAX_CHUNK_LENGTH
+        tmp = tmp_path / "segments.h5"
+        segmentlist = self.create(*(
+            (i, i + 1) for i in range(0, 2 * MAX_CHUNK_LENGTH + 10, 2)
+        ))
+        segmentlist.write(tmp, 'test-segmentlist', compression=compression)
+        with h5py.File(tmp, "r") as h5f:
+            assert h5f["test-segmentlist"].chunks == (MAX_CHUNK_LENGTH,)
+        assert_segmentlist_equal(self.TEST_CLASS.read(tmp), segmentlist)
+
+    def test_write_hdf5_contiguous(self, segmentlist, tmp_path):
+        tmp = tmp_path / "segments.h5"
+        segmentlist.write(tmp, 'test-segmentlist', chunks=None)
+        with h5py.File(tmp, "r") as h5f:
+            assert h5f["test-segmentlist"].chunks is None
+        assert_segmentlist_equal(self.TEST_CLASS.read(tmp), segmentlist)
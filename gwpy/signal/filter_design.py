@@ -33,7 +33,8 @@ from astropy.units import (Unit, Quantity)
 from .window import (get_window, planck)
 
 __author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
-__all__ = ['lowpass', 'highpass', 'bandpass', 'notch', 'concatenate_zpks']
+__all__ = ['lowpass', 'highpass', 'bandpass', 'notch', 'notch_bank',
+           'concatenate_zpks']
 
 
 def _as_float(x):
@@ -630,6 +631,69 @@ def notch(frequency, sample_rate, type='iir', output='zpk', **kwargs):
                                   "implemented yet" % type)
 
 
+def notch_bank(frequencies, sample_rate, Q=30):
+    """Design a ZPK filter that notches out each of a set of frequencies
+
+    Each notch is a second-order IIR notch filter, matching
+    :func:`scipy.signal.iirnotch`, with all notches designed at once.
+
+    Parameters
+    ----------
+    frequencies : `float`, `list`, `~astropy.units.Quantity`
+        one or more frequencies (default in Hertz) at which to apply a notch
+    sample_rate : `float`, `~astropy.units.Quantity`
+        number of samples per second for `TimeSeries` to which this notch
+        filter will be applied
+    Q : `float`, optional
+        quality factor of each notch, the ratio of its centre frequency
+        to its -3 dB bandwidth
+
+    Returns
+    -------
+    zpk : `tuple`
+        the digital filter as a tuple of `(zeros, poles, gain)`, with
+        the zeros and poles given in the Z-domain
+
+    See also
+    --------
+    scipy.signal.iirnotch
+        for details of the design of each notch
+    concatenate_zpks
+        for details on how the individual notches are combined
+
+    Examples
+    --------
+    To notch out a 60 Hz power line and its first two harmonics for
+    4096 Hz-sampled data:
+
+    >>> from gwpy.signal.filter_design import notch_bank
+    >>> zpk = notch_bank([60, 120, 180], 4096)
+    """
+    frequencies = numpy.atleast_1d(Quantity(frequencies, 'Hz').value)
+    sample_rate = Quantity(sample_rate, 'Hz').value
+    w0 = 2 * frequencies / sample_rate
+    if ((w0 <= 0) | (w0 >= 1)).any():
+        raise ValueError("notch frequencies must be between 0 and the "
+                         "Nyquist frequency ({} Hz)".format(sample_rate / 2.))
+    w0 = w0 * pi
+
+    # gain of each notch, from the -3 dB bandwidth
+    gain = 1 / (1 + numpy.tan(w0 / Q / 2))
+
+    # each notch has zeros at exp(+/-i w0) and poles at the roots of
+    # z**2 - 2 g cos(w0) z + (2 g - 1)
+    zeros = numpy.exp(1j * w0)
+    # (the poles are a complex-conjugate pair for narrow notches,
+    # but both real for very wide notches)
+    centre = gain * numpy.cos(w0)
+    root = numpy.lib.scimath.sqrt(centre ** 2 - (2 * gain - 1))
+    return (
+        numpy.stack((zeros, zeros.conj()), axis=-1).ravel(),
+        numpy.stack((centre + root, centre - root), axis=-1).ravel(),
+        gain.prod(),
+    )
+
+
 def concatenate_zpks(*zpks):
     """Concatenate a list of zero-pole-gain (ZPK) filters
 
@@ -27,6 +27,7 @@ This module is deprecated and will be removed in a future release.
 
 import re
 import warnings
+from functools import lru_cache
 
 import numpy
 
@@ -38,17 +39,35 @@ from . import _registry as fft_registry
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
-# cache windows and FFT plans internally
-LAL_WINDOWS = {}
-LAL_FFTPLANS = {}
 LAL_FFTPLAN_LEVEL = 1
 
 
 # -- utilities ----------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _create_fft_plan(length, forward, laltype, level):
+    """Create (and cache) a new LAL FFT plan
+    """
+    from ...utils.lal import find_typed_function
+    create = find_typed_function(laltype, 'Create', 'FFTPlan')
+    return create(length, int(forward), level)
+
+
+@lru_cache(maxsize=None)
+def _create_window(length, name, beta, laltype):
+    """Create (and cache) a new LAL window
+    """
+    from ...utils.lal import find_typed_function
+    create = find_typed_function(laltype, 'CreateNamed', 'Window')
+    return create(name, beta, length)
+
+
 def generate_fft_plan(length, level=None, dtype='float64', forward=True):
     """Build a `REAL8FFTPlan` for a fast Fourier transform.
 
+    Plans are cached, so repeated calls with the same arguments return
+    the same object.
+
     Parameters
     ----------
     length : `int`
@@ -69,27 +88,24 @@ def generate_fft_plan(length, level=None, dtype='float64', forward=True):
     plan : `REAL8FFTPlan` or similar
         FFT plan of the relevant data type
     """
-    from ...utils.lal import (find_typed_function, to_lal_type_str)
-
-    # generate key for caching plan
-    laltype = to_lal_type_str(dtype)
-    key = (length, bool(forward), laltype)
-
-    # find existing plan
-    try:
-        return LAL_FFTPLANS[key]
-    # or create one
-    except KeyError:
-        create = find_typed_function(dtype, 'Create', 'FFTPlan')
-        if level is None:
-            level = LAL_FFTPLAN_LEVEL
-        LAL_FFTPLANS[key] = create(length, int(bool(forward)), level)
-        return LAL_FFTPLANS[key]
+    from ...utils.lal import to_lal_type_str
+
+    if level is None:
+        level = LAL_FFTPLAN_LEVEL
+    return _create_fft_plan(
+        int(length),
+        bool(forward),
+        to_lal_type_str(dtype),
+        int(level),
+    )
 
 
 def generate_window(length, window=None, dtype='float64'):
     """Generate a time-domain window for use in a LAL FFT
 
+    Windows are cached, so repeated calls with the same arguments return
+    the same object.
+
     Parameters
     ----------
     length : `int`
@@ -108,30 +124,23 @@ def generate_window(length, window=None, dtype='float64'):
     `window` : `REAL8Window` or similar
         time-domain window to use for FFT
     """
-    from ...utils.lal import (find_typed_function, to_lal_type_str)
+    from ...utils.lal import to_lal_type_str
 
     if window is None:
         window = ('kaiser', 24)
 
-    # generate key for caching window
-    laltype = to_lal_type_str(dtype)
-    key = (length, str(window), laltype)
-
-    # find existing window
-    try:
-        return LAL_WINDOWS[key]
-    # or create one
-    except KeyError:
-        # parse window as name and arguments, e.g. ('kaiser', 24)
-        if isinstance(window, (list, tuple)):
-            window, beta = window
-        else:
-            beta = 0
-        window = canonical_name(window)
-        # create window
-        create = find_typed_function(dtype, 'CreateNamed', 'Window')
-        LAL_WINDOWS[key] = create(window, beta, length)
-        return LAL_WINDOWS[key]
+    # parse window as name and arguments, e.g. ('kaiser', 24)
+    if isinstance(window, (list, tuple)):
+        window, beta = window
+    else:
+        beta = 0
+
+    return _create_window(
+        int(length),
+        canonical_name(window),
+        float(beta),
+        to_lal_type_str(dtype),
+    )
 
 
 def window_from_array(array, dtype=None):
@@ -117,6 +117,34 @@ def test_notch_design():
         filter_design.notch(60, 16384, type='fir')
 
 
+@pytest.mark.parametrize("frequencies, Q", [
+    ([60, 120, 180.5], 20),
+    ([10, 1000, 1500], .5),  # wide notches (real poles)
+    ([10], .001),
+])
+def test_notch_bank(frequencies, Q):
+    zpk = filter_design.notch_bank(frequencies, 4096, Q=Q)
+    zeros, poles, gain = filter_design.concatenate_zpks(*(
+        signal.tf2zpk(*signal.iirnotch(freq, Q, fs=4096))
+        for freq in frequencies
+    ))
+    for a, b in ((zpk[0], zeros), (zpk[1], poles)):
+        utils.assert_allclose(numpy.sort_complex(a), numpy.sort_complex(b))
+    assert zpk[2] == pytest.approx(gain)
+
+
+def test_notch_bank_errors():
+    # test Quantities
+    utils.assert_zpk_equal(
+        filter_design.notch_bank(60 * ONE_HZ, 4096 * ONE_HZ),
+        filter_design.notch_bank(60, 4096),
+    )
+
+    # test invalid frequencies
+    with pytest.raises(ValueError):
+        filter_design.notch_bank([60, 4096], 4096)
+
+
 def test_lowpass():
     iir = filter_design.lowpass(100, 1024)
     utils.assert_zpk_equal(iir, LOWPASS_IIR_100HZ)
@@ -22,7 +22,7 @@
 import os.path
 import subprocess
 import tempfile
-from contextlib import contextmanager
+from contextlib import (contextmanager, nullcontext)
 from distutils.version import LooseVersion
 from importlib import import_module
 from itertools import zip_longest
@@ -317,7 +317,8 @@ def test_read_write(data, format,
                     extension=None, autoidentify=True,
                     read_args=[], read_kw={},
                     write_args=[], write_kw={},
-                    assert_equal=assert_array_equal, assert_kw={}):
+                    assert_equal=assert_array_equal, assert_kw={},
+                    tmp_path=None):
     """Test that data can be written to and read from a file in some format
 
     Parameters
@@ -353,6 +354,10 @@ def test_read_write(data, format,
 
     assert_kwargs : `dict`, optional
         keyword arguments to pass to ``assert_equal``
+
+    tmp_path : `pathlib.Path`, optional
+        an existing directory in which to write the file, e.g. one shared
+        by many tests, defaults to a new temporary directory
     """
     # parse extension and add leading period
     if extension is None:
@@ -361,8 +366,15 @@ def test_read_write(data, format,
 
     DataClass = type(data)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    if tmp_path is None:
+        tmpdir = tempfile.TemporaryDirectory()
+    else:
+        tmpdir = nullcontext(tmp_path)
+
+    with tmpdir as tmpdir:
         tmp = Path(tmpdir) / "test.{}".format(extension)
+        if tmp.exists():  # remove file from a previous test
+            tmp.unlink()
 
         data.write(tmp, *write_args, format=format, **write_kw)
 